@@ -1,9 +1,21 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
+from textual.worker import get_current_worker
+from widgets.note_card import NoteCard
 from widgets.notes_grid import NotesGrid
 from vault_reader import VaultReader
+from thumbnail_cache import ThumbnailCache
+from config import Config
+from concurrent.futures import Future
+from functools import partial
+from pathlib import Path
 import datetime
+import os
+import subprocess
+import sys
+import threading
+import webbrowser
 
 class ReadItNowApp(App):
     """The main ReadItNow terminal application."""
@@ -34,17 +46,34 @@ class ReadItNowApp(App):
     """
     
     BINDINGS = [
-        ("q", "quit", "Quit"),
         ("ctrl+c", "quit", "Quit"),
-        ("up", "scroll_up", "Scroll Up"),
-        ("down", "scroll_down", "Scroll Down"),
     ]
     
-    def __init__(self, config: dict = None, **kwargs):
+    # Config keybinding name -> (action, description)
+    KEYBINDING_ACTIONS = {
+        'open_link': ("open_link", "Open Link"),
+        'open_file': ("open_file", "Open File"),
+        'up': ("focus_up", "Up"),
+        'down': ("focus_down", "Down"),
+        'left': ("focus_left", "Left"),
+        'right': ("focus_right", "Right"),
+        'page_up': ("page_up", "Page Up"),
+        'page_down': ("page_down", "Page Down"),
+        'toggle_read': ("toggle_read", "Toggle Read"),
+        'quit': ("quit", "Quit"),
+    }
+    
+    def __init__(self, config: Config, **kwargs):
         super().__init__(**kwargs)
-        self.config = config or {}
-        # TODO: check if vault_path and display error to user
-        self.vault_path = self.config.get('vault_path', '')
+        self.config = config
+        self.vault_path = self.config.vault_path
+        
+        # Keybindings are validated and merged with the defaults by the config layer
+        self.keybindings = self.config.keybindings
+        for name, (action, description) in self.KEYBINDING_ACTIONS.items():
+            self.bind(self.keybindings[name], action, description=description)
+        
+        self.thumbnail_cache = ThumbnailCache(self.config)
         
         try:
             # Initialize vault reader
@@ -64,19 +93,174 @@ class ReadItNowApp(App):
         
         # Main content area with notes grid
         with Container(classes="main-content"):
-            yield NotesGrid(self.notes)
+            yield NotesGrid(
+                self.notes,
+                page_size=self.config.performance.page_size,
+                thumbnail_cache=self.thumbnail_cache,
+            )
         
         # Footer with keybindings
-        yield Static("Press 'q' to quit • ↑↓ Scroll • Enter Open", classes="footer")
+        keys = self.keybindings
+        yield Static(
+            f"Press '{keys['quit']}' to quit • Arrows Navigate • {keys['open_link']} Open • "
+            f"{keys['toggle_read']} Toggle Read",
+            classes="footer",
+            markup=False,
+        )
     
     def action_quit(self) -> None:
         """Quit the application."""
         self.exit()
 
-    def action_scroll_up(self) -> None:
-        """Scroll up the notes grid."""
-        self.query_one(NotesGrid).scroll_up()
+    def on_unmount(self) -> None:
+        """Stop thumbnail downloads however the app exits."""
+        self.thumbnail_cache.close()
+
+    def action_focus_up(self) -> None:
+        """Move focus to the card above."""
+        self.query_one(NotesGrid).move_focus(0, -1)
+
+    def action_focus_down(self) -> None:
+        """Move focus to the card below."""
+        self.query_one(NotesGrid).move_focus(0, 1)
+
+    def action_focus_left(self) -> None:
+        """Move focus to the card on the left."""
+        self.query_one(NotesGrid).move_focus(-1, 0)
+
+    def action_focus_right(self) -> None:
+        """Move focus to the card on the right."""
+        self.query_one(NotesGrid).move_focus(1, 0)
+
+    def action_page_up(self) -> None:
+        """Move focus up by one page of cards."""
+        self.query_one(NotesGrid).move_focus_page(-1)
+
+    def action_page_down(self) -> None:
+        """Move focus down by one page of cards."""
+        self.query_one(NotesGrid).move_focus_page(1)
+
+    def action_open_link(self) -> None:
+        """Open the focused note's URL in the default browser."""
+        card = self.query_one(NotesGrid).focused_card
+        if card is None:
+            return
+        
+        url = card.note_data.get('url', '')
+        if not url:
+            self.notify("This note has no link", severity="warning")
+            return
+        
+        # webbrowser can block while it spawns the browser, keep the UI responsive
+        self.run_worker(partial(webbrowser.open, url), group="open", thread=True, exit_on_error=False)
+
+    def action_open_file(self) -> None:
+        """Open the focused note's file in the default editor."""
+        card = self.query_one(NotesGrid).focused_card
+        if card is None:
+            return
+        
+        file_path = card.note_data['file_path']
+        try:
+            if sys.platform == "darwin":
+                subprocess.Popen(["open", file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif os.name == "nt":
+                os.startfile(file_path)
+            else:
+                subprocess.Popen(["xdg-open", file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception as e:
+            self.notify(f"Could not open {Path(file_path).name}: {e}", severity="error")
+
+    def action_toggle_read(self) -> None:
+        """Toggle the read state of the focused note."""
+        card = self.query_one(NotesGrid).focused_card
+        if card is None or self.vault_reader is None:
+            return
+        
+        # The card's read state is kept current by neighbour prefetch, so the
+        # toggle needs no extra parse to find out which way to flip
+        file_path = card.note_data['file_path']
+        if card.note_data['is_read']:
+            updated = self.vault_reader.mark_as_unread(file_path)
+        else:
+            updated = self.vault_reader.mark_as_read(file_path)
+        if not updated:
+            self.notify(f"Could not update {Path(file_path).name}", severity="error")
+            return
+        
+        note_data = self.vault_reader.get_note_by_path(file_path)
+        if note_data:
+            self.notes[card.index] = note_data
+            card.update_note(note_data)
+
+    def on_note_card_focused(self, message: NoteCard.Focused) -> None:
+        """Prefetch the cards around the focused one so actions on them are instant."""
+        if self.vault_reader is None:
+            return
+        
+        grid = self.query_one(NotesGrid)
+        indices = grid.neighbour_indices(message.card.index)
+        neighbours = [self.notes[i] for i in indices]
+        
+        # Thumbnail URLs are known from parsing, so queue them straight away on
+        # the thumbnail pool; each batch cancels downloads queued for older focus
+        thumbnail_urls = [message.card.note_data['thumbnail_url']] + [note['thumbnail_url'] for note in neighbours]
+        downloads = self.thumbnail_cache.prefetch(thumbnail_urls)
+        for url, future in downloads.items():
+            future.add_done_callback(partial(self._thumbnail_downloaded, url))
+        
+        # Exclusive: a newer focus change cancels a note prefetch still in flight
+        self.run_worker(
+            partial(self._prefetch_notes, [(i, self.notes[i]['file_path']) for i in indices]),
+            group="prefetch",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _prefetch_notes(self, targets: list[tuple[int, str]]) -> None:
+        """Re-parse neighbouring notes (runs in a worker thread, no network access)."""
+        worker = get_current_worker()
+        for index, file_path in targets:
+            if worker.is_cancelled:
+                return
+            
+            note_data = self.vault_reader.prefetch_note(file_path)
+            if note_data and not worker.is_cancelled:
+                self.call_from_thread(self._apply_prefetched, index, note_data)
+
+    def _apply_prefetched(self, index: int, note_data: dict) -> None:
+        """Refresh a card with prefetched data so open and toggle act on it directly."""
+        if index >= len(self.notes) or self.notes[index]['file_path'] != note_data['file_path']:
+            return
+        
+        current = self.notes[index]
+        if all(current.get(key) == note_data[key] for key in ('url', 'thumbnail_url', 'is_read', 'tags')):
+            return
+        
+        self.notes[index] = note_data
+        card = self.query_one(NotesGrid).cards[index]
+        card.update_note(note_data)
+        card.set_thumbnail(self.thumbnail_cache.get(note_data['thumbnail_url']))
+
+    def _thumbnail_downloaded(self, url: str, future: Future) -> None:
+        """Done callback for a thumbnail download; usually runs on a pool thread."""
+        if future.cancelled() or future.result() is None:
+            return
+        
+        if threading.current_thread() is threading.main_thread():
+            # The download finished before the callback was attached
+            self._show_thumbnail(url)
+            return
+        try:
+            self.call_from_thread(self._show_thumbnail, url)
+        except RuntimeError:
+            # The app has already stopped
+            pass
 
-    def action_scroll_down(self) -> None:
-        """Scroll down the notes grid."""
-        self.query_one(NotesGrid).scroll_down() 
\ No newline at end of file
+    def _show_thumbnail(self, url: str) -> None:
+        """Mark the cards whose thumbnail just finished downloading."""
+        path = self.thumbnail_cache.get(url)
+        for card in self.query_one(NotesGrid).cards:
+            if card.note_data.get('thumbnail_url') == url:
+                card.set_thumbnail(path)
\ No newline at end of file
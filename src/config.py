@@ -1,10 +1,19 @@
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import tempfile
 import yaml
 
 APP_NAME = "readitnow"
 CONFIG_DIR = Path.home() / ".config" / APP_NAME
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 CACHE_DIR = Path.home() / ".cache" / APP_NAME
+CONFIG_CACHE_FILE = CACHE_DIR / "config.json"
+
+# Bump when the compiled config layout changes so stale caches are recompiled
+CONFIG_CACHE_VERSION = 5
 
 DEFAULT_CONFIG = {
     'vault_path': str(Path.home() / "vault" / "ReadItLater Inbox"),
@@ -19,32 +28,237 @@ DEFAULT_CONFIG = {
         'right': "right",
         'page_up': "pageup",
         'page_down': "pagedown",
+        'toggle_read': "r",
         'quit': "q",
     },
     'thumbnail_cache': str(CACHE_DIR / "thumbnails"),
+    'performance': {
+        'parse_workers': 4,
+        'prefetch_workers': 2,
+        'page_size': 6,
+    },
 }
 
-def load_or_create_config() -> dict:
+
+class ConfigError(ValueError):
+    """Raised when the configuration file contains invalid values."""
+
+
+@dataclass(frozen=True)
+class PerformanceConfig:
+    """Tuning knobs shared by VaultReader, NoteParser and the widgets."""
+
+    # Threads used to parse notes when loading the vault
+    parse_workers: int
+    # Threads used to download thumbnails of neighbouring cards
+    prefetch_workers: int
+    # Cards moved by page up/page down
+    page_size: int
+
+
+@dataclass(frozen=True)
+class Config:
+    """Validated runtime configuration."""
+
+    vault_path: str
+    max_notes: int
+    excerpt_lines: int
+    keybindings: Dict[str, str]
+    thumbnail_cache: str
+    performance: PerformanceConfig
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Config":
+        """Rebuild a config from its compiled (already validated) form."""
+        values = dict(data)
+        values['performance'] = PerformanceConfig(**values['performance'])
+        return cls(**values)
+
+
+def _require_int(raw: dict, key: str, minimum: int, section: str = "") -> int:
+    """Return raw[key] as an int, rejecting bools, strings and values below minimum."""
+    value = raw[key]
+    name = f"{section}.{key}" if section else key
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ConfigError(f"'{name}' must be an integer, got {value!r}")
+    if value < minimum:
+        raise ConfigError(f"'{name}' must be at least {minimum}, got {value}")
+    return value
+
+
+def _compile_keybindings(raw) -> Dict[str, str]:
+    """Merge user keybindings over the defaults, trimming surrounding whitespace."""
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ConfigError("'keybindings' must be a mapping of action to key")
+
+    unknown = set(raw) - set(DEFAULT_CONFIG['keybindings'])
+    if unknown:
+        raise ConfigError(f"Unknown keybinding(s): {', '.join(sorted(unknown))}")
+
+    keybindings = {}
+    for name, default in DEFAULT_CONFIG['keybindings'].items():
+        key = raw.get(name, default)
+        if not isinstance(key, str) or not key.strip():
+            raise ConfigError(f"Keybinding '{name}' must be a non-empty string")
+        # Key names are case-sensitive in Textual ("R" is Shift+R), so only trim
+        keybindings[name] = key.strip()
+
+    # The same key bound to two actions would silently shadow one of them
+    seen = {}
+    for name, key in keybindings.items():
+        if key in seen:
+            raise ConfigError(f"Key '{key}' is bound to both '{seen[key]}' and '{name}'")
+        seen[key] = name
+
+    return keybindings
+
+
+def _compile_performance(raw) -> PerformanceConfig:
+    """Validate the performance section, filling in defaults."""
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ConfigError("'performance' must be a mapping")
+
+    defaults = DEFAULT_CONFIG['performance']
+    unknown = set(raw) - set(defaults)
+    if unknown:
+        raise ConfigError(f"Unknown performance setting(s): {', '.join(sorted(unknown))}")
+
+    merged = {**defaults, **raw}
+    return PerformanceConfig(
+        parse_workers=_require_int(merged, 'parse_workers', 1, "performance"),
+        prefetch_workers=_require_int(merged, 'prefetch_workers', 1, "performance"),
+        page_size=_require_int(merged, 'page_size', 1, "performance"),
+    )
+
+
+def _check_paths(vault_path: Path, thumbnail_cache_path: Path) -> None:
+    """
+    Cheap filesystem checks that must hold on every launch, cached or not.
+    Creates the thumbnail cache directory if it is missing.
+    """
+    if not vault_path.is_dir():
+        raise ConfigError(f"'vault_path' is not an existing directory: {vault_path}")
+    if thumbnail_cache_path.is_dir():
+        return
+    try:
+        thumbnail_cache_path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        raise ConfigError(f"Cannot create thumbnail cache {thumbnail_cache_path}: {e}")
+
+
+def compile_config(raw) -> Config:
+    """
+    Validates raw YAML data and normalizes it into a Config.
+    Creates the thumbnail cache directory as a side effect.
+    """
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, dict):
+        raise ConfigError("Configuration must be a mapping of settings")
+
+    known = {field.name for field in fields(Config)}
+    unknown = set(raw) - known
+    if unknown:
+        raise ConfigError(f"Unknown setting(s): {', '.join(sorted(unknown))}")
+
+    vault_path = raw.get('vault_path')
+    if not isinstance(vault_path, str) or not vault_path.strip():
+        raise ConfigError("'vault_path' is required and must point to your ReadItLater folder")
+    vault_path = Path(vault_path).expanduser()
+
+    merged = {**DEFAULT_CONFIG, **raw}
+
+    thumbnail_cache = merged['thumbnail_cache']
+    if not isinstance(thumbnail_cache, str) or not thumbnail_cache.strip():
+        raise ConfigError("'thumbnail_cache' must be a directory path")
+    thumbnail_cache_path = Path(thumbnail_cache).expanduser()
+    _check_paths(vault_path, thumbnail_cache_path)
+
+    return Config(
+        vault_path=str(vault_path),
+        max_notes=_require_int(merged, 'max_notes', 1),
+        excerpt_lines=_require_int(merged, 'excerpt_lines', 1),
+        keybindings=_compile_keybindings(merged['keybindings']),
+        thumbnail_cache=str(thumbnail_cache_path),
+        performance=_compile_performance(merged['performance']),
+    )
+
+
+def _cache_key(config_file: Path) -> dict:
+    """Identify a config file revision without reading its contents."""
+    stat = config_file.stat()
+    return {
+        'version': CONFIG_CACHE_VERSION,
+        'source': str(config_file),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+    }
+
+
+def _load_cached_config(cache_key: dict) -> Optional[Config]:
+    """Return the compiled config if the cache matches the current file revision."""
+    try:
+        with open(CONFIG_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('key') != cache_key:
+            return None
+        return Config.from_dict(cached['config'])
+    except Exception:
+        # Missing or corrupt cache: fall back to compiling from YAML
+        return None
+
+
+def _save_cached_config(cache_key: dict, config: Config) -> None:
+    """Persist the compiled config; failures only cost a recompile next launch."""
+    tmp_name = None
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temporary file per launch, so concurrent launches never
+        # interleave writes before the atomic rename
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=CONFIG_CACHE_FILE.parent, suffix='.tmp', delete=False
+        ) as f:
+            tmp_name = f.name
+            json.dump({'key': cache_key, 'config': asdict(config)}, f)
+        os.replace(tmp_name, CONFIG_CACHE_FILE)
+    except OSError:
+        if tmp_name:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def load_or_create_config() -> Config:
     """
     Loads configuration from the user's config directory.
     If no config file is found, it creates one with default values.
+    The compiled result is cached and reused until the file changes.
+    Raises ConfigError if the file contains invalid settings.
     """
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-
     if not CONFIG_FILE.is_file():
         print(f"Configuration file not found. Creating a default one at: {CONFIG_FILE}")
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         with open(CONFIG_FILE, 'w') as f:
             yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, sort_keys=False)
 
-    with open(CONFIG_FILE, 'r') as f:
-        config_data = yaml.safe_load(f)
+    cache_key = _cache_key(CONFIG_FILE)
+    config = _load_cached_config(cache_key)
+    if config is not None:
+        # The vault may have moved since the config was compiled
+        _check_paths(Path(config.vault_path), Path(config.thumbnail_cache))
+        return config
 
-    # Ensure thumbnail cache dir exists, creating it if necessary
-    thumbnail_cache_path = Path(config_data.get('thumbnail_cache', DEFAULT_CONFIG['thumbnail_cache']))
-    thumbnail_cache_path.mkdir(parents=True, exist_ok=True)
-    config_data['thumbnail_cache'] = str(thumbnail_cache_path)
-
-    # Ensure vault_path is expanded
-    config_data['vault_path'] = str(Path(config_data['vault_path']).expanduser())
+    with open(CONFIG_FILE, 'r') as f:
+        try:
+            config_data = yaml.safe_load(f)
+        except yaml.YAMLError as e:
+            raise ConfigError(f"Could not parse YAML: {e}")
 
-    return config_data 
\ No newline at end of file
+    config = compile_config(config_data)
+    _save_cached_config(cache_key, config)
+    return config
@@ -6,7 +6,7 @@ This is the main entrypoint for the ReadItNow application.
 """
 
 import sys
-from config import load_or_create_config
+from config import CONFIG_FILE, ConfigError, load_or_create_config
 from app import ReadItNowApp
 
 def check_dependencies():
@@ -31,9 +31,14 @@ def main():
         sys.exit(1)
     
     # Load configuration
-    config = load_or_create_config()
+    try:
+        config = load_or_create_config()
+    except ConfigError as e:
+        print(f"❌ Invalid configuration in {CONFIG_FILE}: {e}")
+        sys.exit(1)
     
     # Launch the TUI application
+    app = None
     try:
         app = ReadItNowApp(config=config)
         app.run()
@@ -42,6 +47,10 @@ def main():
     except Exception as e:
         print(f"❌ Error running ReadItNow: {e}")
         sys.exit(1)
+    finally:
+        # Unmount does not run if the app fails before it starts
+        if app is not None:
+            app.thumbnail_cache.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,13 +2,14 @@ import re
 from pathlib import Path
 from typing import List, Dict
 import datetime
+from config import Config
 
 class NoteParser:
     """Parse Obsidian-format notes with robust error handling."""
     
-    def __init__(self, config: dict):
+    def __init__(self, config: Config):
         self.config = config
-        self.excerpt_lines = config.get('excerpt_lines', 5)
+        self.excerpt_lines = config.excerpt_lines
         self.skip_empty_lines = True
         self.strip_markdown = True
         self.safe_mode = True
@@ -0,0 +1,112 @@
+import hashlib
+import os
+import tempfile
+import threading
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from config import Config
+
+class ThumbnailCache:
+    """Download note thumbnails into the on-disk thumbnail cache."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.cache_dir = Path(config.thumbnail_cache)
+        self.timeout = 5
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.performance.prefetch_workers,
+            thread_name_prefix="thumbnail",
+        )
+        # url -> download queued or running; reentrant because done callbacks
+        # run inline when a future finishes before they are attached
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+
+    def cache_path(self, url: str) -> Path:
+        """Return the cache location for a thumbnail URL."""
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        suffix = Path(url.split('?', 1)[0]).suffix or '.jpg'
+        return self.cache_dir / f"{digest}{suffix}"
+
+    def get(self, url: str) -> Optional[Path]:
+        """Return the cached thumbnail for a URL, if it has already been downloaded."""
+        if not url:
+            return None
+        path = self.cache_path(url)
+        return path if path.is_file() else None
+
+    def fetch(self, url: str) -> Optional[Path]:
+        """Download a thumbnail unless it is already cached."""
+        if not url:
+            return None
+
+        path = self.cache_path(url)
+        if path.is_file():
+            return path
+
+        tmp_name = None
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                data = response.read()
+
+            # Each download gets its own temporary file so concurrent fetches
+            # of one URL never share a partial file; readers only see the rename
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.part', delete=False) as f:
+                tmp_name = f.name
+                f.write(data)
+            os.replace(tmp_name, path)
+
+            return path
+        except Exception:
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            return None
+
+    def prefetch(self, urls: List[str]) -> Dict[str, Future]:
+        """
+        Download a batch of thumbnails in the background.
+        Queued downloads from earlier batches that are no longer wanted are
+        cancelled, and URLs already downloading share the existing future.
+        Returns the pending download for each URL not yet cached.
+        """
+        wanted = set(urls)
+        futures = {}
+
+        with self._lock:
+            for url, future in list(self._pending.items()):
+                # Cancelling runs the done callback, which forgets the URL
+                if url not in wanted:
+                    future.cancel()
+
+            for url in urls:
+                if not url or self.get(url):
+                    continue
+
+                future = self._pending.get(url)
+                if future is None:
+                    try:
+                        future = self._executor.submit(self.fetch, url)
+                    except RuntimeError:
+                        # Executor already shut down while the app is exiting
+                        break
+                    self._pending[url] = future
+                    future.add_done_callback(lambda done, url=url: self._forget(url, done))
+                futures[url] = future
+
+        return futures
+
+    def _forget(self, url: str, future: Future) -> None:
+        """Drop a finished download from the pending table."""
+        with self._lock:
+            if self._pending.get(url) is future:
+                del self._pending[url]
+
+    def close(self) -> None:
+        """Drop queued downloads and stop accepting new ones."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
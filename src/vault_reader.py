@@ -1,16 +1,19 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
+from config import Config
 from note_parser import NoteParser
 import re
 
 class VaultReader:
     """Manage reading and organizing notes from the Obsidian vault."""
     
-    def __init__(self, config: dict):
+    def __init__(self, config: Config):
         self.config = config
-        self.vault_path = Path(config['vault_path'])
-        self.max_notes = config.get('max_notes', 20)
+        self.vault_path = Path(config.vault_path)
+        self.max_notes = config.max_notes
+        self.parse_workers = config.performance.parse_workers
         self.parser = NoteParser(config)
         
         # Validate vault path
@@ -34,23 +37,28 @@ class VaultReader:
             # Limit to max_notes
             md_files = md_files[:self.max_notes]
             
-            # Parse each file
-            notes = []
-            for file_path in md_files:
-                try:
-                    note_data = self.parser.parse_file(file_path)
-                    notes.append(note_data)
-                except Exception as e:
-                    # Log error but continue with other files
-                    print(f"Warning: Could not parse {file_path}: {e}")
-                    continue
+            # Parse files in parallel, keeping the newest-first order
+            if self.parse_workers > 1 and len(md_files) > 1:
+                with ThreadPoolExecutor(max_workers=self.parse_workers) as executor:
+                    results = list(executor.map(self._parse_or_none, md_files))
+            else:
+                results = [self._parse_or_none(file_path) for file_path in md_files]
             
-            return notes
+            return [note_data for note_data in results if note_data is not None]
             
         except Exception as e:
             print(f"Error reading vault: {e}")
             return []
     
+    def _parse_or_none(self, file_path: Path) -> Optional[dict]:
+        """Parse a single file, logging and skipping it on failure."""
+        try:
+            return self.parser.parse_file(file_path)
+        except Exception as e:
+            # Log error but continue with other files
+            print(f"Warning: Could not parse {file_path}: {e}")
+            return None
+    
     def get_note_by_path(self, file_path: str) -> Optional[dict]:
         """Get a specific note by its file path."""
         try:
@@ -63,6 +71,18 @@ class VaultReader:
             print(f"Error reading note {file_path}: {e}")
             return None
     
+    def prefetch_note(self, file_path: str) -> Optional[dict]:
+        """Re-parse a note ahead of use so its card holds current data."""
+        try:
+            path = Path(file_path)
+            if not path.is_file():
+                return None
+            
+            return self.parser.parse_file(path)
+        except Exception:
+            # Prefetching is best-effort; the note is simply read again on demand
+            return None
+    
     def mark_as_read(self, file_path: str) -> bool:
         """Mark a note as read by adding [[readitnow/read]] tag."""
         try:
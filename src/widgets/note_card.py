@@ -1,7 +1,11 @@
+from pathlib import Path
+from typing import Optional
+from rich.text import Text
 from textual.containers import Container, Vertical
 from textual.widgets import Static, Label
 from textual.widget import Widget
 from textual.app import ComposeResult
+from textual.message import Message
 
 class NoteCard(Widget):
     """A card widget representing a single note from ReadItLater."""
@@ -20,6 +24,11 @@ class NoteCard(Widget):
         background: $primary-background;
     }
     
+    NoteCard:focus {
+        border: double $accent;
+        background: $primary-background;
+    }
+    
     NoteCard.read {
         opacity: 0.7;
         border: solid;
@@ -53,16 +62,28 @@ class NoteCard(Widget):
     }
     """
     
-    def __init__(self, note_data: dict, **kwargs):
+    can_focus = True
+    
+    class Focused(Message):
+        """Posted when a card receives keyboard focus."""
+        
+        def __init__(self, card: "NoteCard") -> None:
+            super().__init__()
+            self.card = card
+    
+    def __init__(self, note_data: dict, index: int = 0, thumbnail_path: Optional[Path] = None, **kwargs):
         super().__init__(**kwargs)
         self.note_data = note_data
+        self.index = index
+        self.thumbnail_path = thumbnail_path
         self.is_read = note_data.get("is_read", False)
         
     def compose(self) -> ComposeResult:
         """Create the note card layout."""
         with Container():
-            # Thumbnail placeholder
-            yield Static("🖼️", classes="thumbnail")
+            # Thumbnail badge: images are not drawn yet, but cards with a
+            # downloaded preview are told apart from the plain placeholder
+            yield Static(self._thumbnail_text(), classes="thumbnail")
             
             # Content area
             with Vertical(classes="content"):
@@ -79,15 +100,39 @@ class NoteCard(Widget):
                 yield Label(excerpt, classes="excerpt", markup=False)
                 
                 # Tags
-                tags = self.note_data.get("tags", [])
-                tag_text = " ".join([f"#{tag}" for tag in tags[:3]])  # Show max 3 tags
-                if len(tags) > 3:
-                    tag_text += " ..."
-                if self.is_read:
-                    tag_text = "✅ " + tag_text
-                yield Label(tag_text, classes="tags", markup=False)
+                yield Label(self._tag_text(), classes="tags", markup=False)
+    
+    def _thumbnail_text(self) -> str:
+        """Badge shown in the thumbnail slot."""
+        return "🖼️" if self.thumbnail_path else "📄"
+    
+    def _tag_text(self) -> str:
+        """Build the tag line, prefixed with a badge for read notes."""
+        tags = self.note_data.get("tags", [])
+        tag_text = " ".join([f"#{tag}" for tag in tags[:3]])  # Show max 3 tags
+        if len(tags) > 3:
+            tag_text += " ..."
+        if self.is_read:
+            tag_text = "✅ " + tag_text
+        return tag_text
     
     def on_mount(self) -> None:
         """Apply read styling if needed."""
         if self.is_read:
-            self.add_class("read") 
\ No newline at end of file
+            self.add_class("read")
+    
+    def on_focus(self) -> None:
+        """Let the grid and app know which card is active."""
+        self.post_message(self.Focused(self))
+    
+    def update_note(self, note_data: dict) -> None:
+        """Refresh the card after its note changed on disk."""
+        self.note_data = note_data
+        self.is_read = note_data.get("is_read", False)
+        self.set_class(self.is_read, "read")
+        self.query_one(".tags", Label).update(Text(self._tag_text())) 
+    
+    def set_thumbnail(self, thumbnail_path: Optional[Path]) -> None:
+        """Show whether a downloaded thumbnail is available for this note."""
+        self.thumbnail_path = thumbnail_path
+        self.query_one(".thumbnail", Static).update(self._thumbnail_text())
\ No newline at end of file
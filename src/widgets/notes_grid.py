@@ -1,9 +1,11 @@
+from typing import List, Optional, Tuple
 from textual.app import ComposeResult
 from textual.containers import Horizontal, ScrollableContainer
 from textual.widgets import Static
+from thumbnail_cache import ThumbnailCache
 from widgets.note_card import NoteCard
 
-class NotesGrid(ScrollableContainer):
+class NotesGrid(ScrollableContainer, inherit_bindings=False):
     """A scrollable container for notes in a 2-column grid."""
     
     DEFAULT_CSS = """
@@ -18,9 +20,18 @@ class NotesGrid(ScrollableContainer):
     }
     """
     
-    def __init__(self, notes: list[dict], **kwargs):
+    COLUMNS = 2
+    
+    # Keyboard focus lives on the cards; navigation keys are bound by the app
+    can_focus = False
+    
+    def __init__(self, notes: list[dict], page_size: int, thumbnail_cache: ThumbnailCache, **kwargs):
         super().__init__(**kwargs)
         self.notes = notes
+        self.page_size = page_size
+        self.thumbnail_cache = thumbnail_cache
+        self.focused_index = 0
+        self.last_move: Tuple[int, int] = (0, 1)
     
     def compose(self) -> ComposeResult:
         """Create the 2-column grid of note cards."""
@@ -28,11 +39,94 @@ class NotesGrid(ScrollableContainer):
         for i in range(0, len(self.notes), 2):
             with Horizontal(classes="grid-row"):
                 # Left column
-                yield NoteCard(self.notes[i])
+                yield self._make_card(i)
                 
                 # Right column (if exists)
                 if i + 1 < len(self.notes):
-                    yield NoteCard(self.notes[i + 1])
+                    yield self._make_card(i + 1)
                 else:
                     # Empty space for odd number of notes
-                    yield Static() 
\ No newline at end of file
+                    yield Static()
+    
+    def _make_card(self, index: int) -> NoteCard:
+        """Build the card for a note, marking a thumbnail already on disk."""
+        note = self.notes[index]
+        return NoteCard(note, index=index, thumbnail_path=self.thumbnail_cache.get(note.get('thumbnail_url', '')))
+    
+    def on_mount(self) -> None:
+        """Focus the first card once the grid has been laid out."""
+        self.call_after_refresh(self.focus_note, 0)
+    
+    def on_note_card_focused(self, message: NoteCard.Focused) -> None:
+        """Track the active card, including focus changes made with the mouse."""
+        self.focused_index = message.card.index
+    
+    @property
+    def cards(self) -> List[NoteCard]:
+        """All note cards in note order."""
+        return list(self.query(NoteCard))
+    
+    @property
+    def focused_card(self) -> Optional[NoteCard]:
+        """The card that currently holds focus, if any."""
+        cards = self.cards
+        if 0 <= self.focused_index < len(cards):
+            return cards[self.focused_index]
+        return None
+    
+    def focus_note(self, index: int) -> None:
+        """Move focus to the card at index and scroll it into view."""
+        cards = self.cards
+        if not 0 <= index < len(cards):
+            return
+        
+        self.focused_index = index
+        cards[index].focus()
+    
+    def move_focus(self, dx: int, dy: int) -> None:
+        """Move focus by dx columns and dy rows, staying inside the grid."""
+        row, col = divmod(self.focused_index, self.COLUMNS)
+        col += dx
+        row += dy
+        index = row * self.COLUMNS + col
+        if not 0 <= col < self.COLUMNS or not 0 <= index < len(self.notes):
+            return
+        
+        self.last_move = (dx, dy)
+        self.focus_note(index)
+    
+    def move_focus_page(self, direction: int) -> None:
+        """Move focus a page of cards up (-1) or down (1), stopping at the edges."""
+        if not self.notes:
+            return
+        
+        rows = max(1, self.page_size // self.COLUMNS)
+        row, col = divmod(self.focused_index, self.COLUMNS)
+        last_row = (len(self.notes) - 1) // self.COLUMNS
+        row = min(max(row + direction * rows, 0), last_row)
+        
+        self.last_move = (0, direction)
+        self.focus_note(min(row * self.COLUMNS + col, len(self.notes) - 1))
+    
+    def neighbour_indices(self, index: int) -> List[int]:
+        """
+        Indices of the cards likely to be visited next from index.
+        Cards further along the last movement direction come first.
+        """
+        row, col = divmod(index, self.COLUMNS)
+        dx, dy = self.last_move
+        
+        steps = [(dx, dy), (2 * dx, 2 * dy)]
+        steps += [step for step in ((0, 1), (0, -1), (1, 0), (-1, 0)) if step != (dx, dy)]
+        
+        neighbours = []
+        for step_x, step_y in steps:
+            new_col = col + step_x
+            new_row = row + step_y
+            if not 0 <= new_col < self.COLUMNS:
+                continue
+            neighbour = new_row * self.COLUMNS + new_col
+            if 0 <= neighbour < len(self.notes) and neighbour != index and neighbour not in neighbours:
+                neighbours.append(neighbour)
+        
+        return neighbours
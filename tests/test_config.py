@@ -0,0 +1,158 @@
+import os
+
+import pytest
+import yaml
+
+import config
+from config import ConfigError, DEFAULT_CONFIG, compile_config, load_or_create_config
+
+
+@pytest.fixture
+def vault(tmp_path):
+    path = tmp_path / "vault"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def config_paths(tmp_path, monkeypatch):
+    """Point the config and cache locations into tmp_path."""
+    config_dir = tmp_path / "config"
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(config, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config, "CONFIG_FILE", config_dir / "config.yaml")
+    monkeypatch.setattr(config, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(config, "CONFIG_CACHE_FILE", cache_dir / "config.json")
+    return config_dir / "config.yaml"
+
+
+def write_config(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        yaml.dump(data, f)
+
+
+def base(vault, tmp_path, **overrides):
+    return {'vault_path': str(vault), 'thumbnail_cache': str(tmp_path / "thumbs"), **overrides}
+
+
+def test_defaults_are_merged(vault, tmp_path):
+    cfg = compile_config(base(vault, tmp_path))
+
+    assert cfg.vault_path == str(vault)
+    assert cfg.max_notes == DEFAULT_CONFIG['max_notes']
+    assert cfg.keybindings == DEFAULT_CONFIG['keybindings']
+    assert cfg.performance.page_size == DEFAULT_CONFIG['performance']['page_size']
+    assert (tmp_path / "thumbs").is_dir()
+
+
+def test_partial_sections_override_one_key(vault, tmp_path):
+    cfg = compile_config(base(
+        vault, tmp_path,
+        keybindings={'toggle_read': " R "},
+        performance={'parse_workers': 1},
+    ))
+
+    # Key names are case-sensitive, only whitespace is trimmed
+    assert cfg.keybindings['toggle_read'] == "R"
+    assert cfg.keybindings['quit'] == DEFAULT_CONFIG['keybindings']['quit']
+    assert cfg.performance.parse_workers == 1
+    assert cfg.performance.prefetch_workers == DEFAULT_CONFIG['performance']['prefetch_workers']
+
+
+@pytest.mark.parametrize("overrides", [
+    {'bogus': 1},
+    {'max_notes': "20"},
+    {'max_notes': True},
+    {'excerpt_lines': 0},
+    {'keybindings': ["q"]},
+    {'keybindings': {'jump': "j"}},
+    {'keybindings': {'up': ""}},
+    {'keybindings': {'up': "q"}},
+    {'performance': {'bogus': 1}},
+    {'performance': {'parse_workers': 0}},
+    {'thumbnail_cache': ""},
+])
+def test_invalid_settings_are_rejected(vault, tmp_path, overrides):
+    with pytest.raises(ConfigError):
+        compile_config(base(vault, tmp_path, **overrides))
+
+
+@pytest.mark.parametrize("raw", [None, [], "vault"])
+def test_non_mapping_root_is_rejected(raw):
+    with pytest.raises(ConfigError):
+        compile_config(raw)
+
+
+def test_missing_vault_is_rejected(tmp_path):
+    with pytest.raises(ConfigError):
+        compile_config({'vault_path': str(tmp_path / "missing")})
+
+
+def test_first_run_creates_default_config(config_paths, monkeypatch, tmp_path):
+    vault = tmp_path / "default-vault"
+    vault.mkdir()
+    monkeypatch.setitem(config.DEFAULT_CONFIG, 'vault_path', str(vault))
+    monkeypatch.setitem(config.DEFAULT_CONFIG, 'thumbnail_cache', str(tmp_path / "thumbs"))
+
+    cfg = load_or_create_config()
+
+    assert config_paths.is_file()
+    assert cfg.vault_path == str(vault)
+
+
+def test_bad_yaml_is_reported(config_paths):
+    config_paths.parent.mkdir(parents=True)
+    config_paths.write_text("vault_path: [unclosed\n")
+
+    with pytest.raises(ConfigError):
+        load_or_create_config()
+
+
+def test_warm_start_skips_yaml(config_paths, vault, tmp_path, monkeypatch):
+    write_config(config_paths, base(vault, tmp_path))
+    cold = load_or_create_config()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed on a warm start")
+
+    monkeypatch.setattr(yaml, "safe_load", fail)
+    assert load_or_create_config() == cold
+
+
+def test_cache_is_invalidated_when_file_changes(config_paths, vault, tmp_path):
+    write_config(config_paths, base(vault, tmp_path, max_notes=10))
+    assert load_or_create_config().max_notes == 10
+
+    write_config(config_paths, base(vault, tmp_path, max_notes=30))
+    # Force a distinct mtime even on coarse filesystem clocks
+    stat = config_paths.stat()
+    os.utime(config_paths, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_or_create_config().max_notes == 30
+
+
+def test_cache_from_other_version_is_ignored(config_paths, vault, tmp_path, monkeypatch):
+    write_config(config_paths, base(vault, tmp_path))
+    load_or_create_config()
+
+    monkeypatch.setattr(config, "CONFIG_CACHE_VERSION", config.CONFIG_CACHE_VERSION + 1)
+    assert config._load_cached_config(config._cache_key(config_paths)) is None
+
+
+def test_warm_start_rechecks_vault(config_paths, vault, tmp_path):
+    write_config(config_paths, base(vault, tmp_path))
+    load_or_create_config()
+
+    vault.rmdir()
+    with pytest.raises(ConfigError):
+        load_or_create_config()
+
+
+def test_warm_start_recreates_thumbnail_dir(config_paths, vault, tmp_path):
+    write_config(config_paths, base(vault, tmp_path))
+    load_or_create_config()
+
+    (tmp_path / "thumbs").rmdir()
+    load_or_create_config()
+    assert (tmp_path / "thumbs").is_dir()